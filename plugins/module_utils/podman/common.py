@@ -123,12 +123,16 @@ def run_generate_systemd_command(module, module_params, name, version):
 
 
 def compare_systemd_file_content(file_path, file_content):
-    if not os.path.exists(file_path):
+    # Read the file
+    try:
+        with open(file_path, 'r') as unit_file:
+            current_unit_file_content = unit_file.read()
+    except FileNotFoundError:
         # File does not exist, so all lines in file_content are different
         return '', file_content
-    # Read the file
-    with open(file_path, 'r') as unit_file:
-        current_unit_file_content = unit_file.read()
+    # Identical content is the common case, no need to compare line by line
+    if current_unit_file_content == file_content:
+        return None
 
     # Function to remove comments from file content
     def remove_comments(content):
@@ -258,6 +262,11 @@ def lower_keys(x):
         return x
 
 
+def sorted_unique(values):
+    """Sort values without duplicates so that lists compare regardless of order."""
+    return sorted(set(values or ()))
+
+
 def remove_file_or_dir(path):
     if os.path.isfile(path):
         os.unlink(path)
@@ -6,6 +6,7 @@ import shlex  # noqa: F402
 from ansible.module_utils._text import to_bytes, to_native  # noqa: F402
 from ansible_collections.containers.podman.plugins.module_utils.podman.common import LooseVersion
 from ansible_collections.containers.podman.plugins.module_utils.podman.common import lower_keys
+from ansible_collections.containers.podman.plugins.module_utils.podman.common import sorted_unique
 from ansible_collections.containers.podman.plugins.module_utils.podman.common import generate_systemd
 from ansible_collections.containers.podman.plugins.module_utils.podman.common import delete_systemd
 from ansible_collections.containers.podman.plugins.module_utils.podman.common import diff_generic
@@ -976,7 +977,7 @@ class PodmanContainerDiff:
                 cap = cap if cap.startswith('cap_') else 'cap_' + cap
                 after.append(cap)
         after += before
-        before, after = sorted(list(set(before))), sorted(list(set(after)))
+        before, after = sorted_unique(before), sorted_unique(after)
         return self._diff_update_and_compare('cap_add', before, after)
 
     def diffparam_cap_drop(self):
@@ -989,7 +990,7 @@ class PodmanContainerDiff:
                 cap = cap if cap.startswith('cap_') else 'cap_' + cap
                 if cap in after:
                     after.remove(cap)
-        before, after = sorted(list(set(before))), sorted(list(set(after)))
+        before, after = sorted_unique(before), sorted_unique(after)
         return self._diff_update_and_compare('cap_drop', before, after)
 
     def diffparam_cgroup_conf(self):
@@ -406,11 +406,13 @@ class PodmanPodDiff:
         return params_with_defaults
 
     def _diff_update_and_compare(self, param_name, before, after):
-        if before != after:
-            self.diff['before'].update({param_name: before})
-            self.diff['after'].update({param_name: after})
-            return True
-        return False
+        # Most runs are idempotent, so check the no-change case first.
+        # Empty values of different types (None, '', [], {}) are equal too.
+        if before is after or before == after or (not before and not after):
+            return False
+        self.diff['before'].update({param_name: before})
+        self.diff['after'].update({param_name: after})
+        return True
 
     def _diff_generic(self, module_arg, cmd_arg, boolean_type=False):
         """
@@ -667,6 +669,8 @@ class PodmanPod:
         self.version = self._get_podman_version()
         self.diff = {}
         self.actions = []
+        self._different = None
+        self._ps_info = None
 
     @property
     def exists(self):
@@ -676,6 +680,10 @@ class PodmanPod:
     @property
     def different(self):
         """Check if pod is different."""
+        # info and infra_info are never refreshed, so the comparison is done
+        # once and memoized for the whole run
+        if self._different is not None:
+            return self._different
         diffcheck = PodmanPodDiff(
             self.module,
             self.module_params,
@@ -691,6 +699,7 @@ class PodmanPod:
             self.diff['after'] = "\n".join(
                 ["%s - %s" % (k, v) for k, v in sorted(
                     diffs['after'].items())]) + "\n"
+        self._different = is_different
         return is_different
 
     @property
@@ -739,10 +748,13 @@ class PodmanPod:
 
     def get_ps(self):
         """Inspect pod process and gather info about it."""
+        if self._ps_info is not None:
+            return self._ps_info
         # pylint: disable=unused-variable
         rc, out, err = self.module.run_command(
             [self.module_params['executable'], b'pod', b'ps', b'--format', b'json', b'--filter', 'name=' + self.name])
-        return json.loads(out)[0] if rc == 0 else {}
+        self._ps_info = json.loads(out)[0] if rc == 0 else {}
+        return self._ps_info
 
     def get_infra_info(self):
         """Inspect pod and gather info about it."""
@@ -783,6 +795,7 @@ class PodmanPod:
                             + [to_native(i) for i in b_command])
         self.module.log("PODMAN-POD-DEBUG: %s" % full_cmd)
         self.actions.append(full_cmd)
+        self._ps_info = None
         if not self.module.check_mode:
             rc, out, err = self.module.run_command(
                 [self.module_params['executable'], b'pod'] + b_command,
@@ -918,11 +931,11 @@ class PodmanPodManager:
         if self.pod.exists:
             if self.pod.different or self.recreate:
                 self.pod.recreate()
-                self.results['actions'].append('recreated %s' % self.pod.name)
+                self.results['actions'].append(f'recreated {self.name}')
                 changed = True
-        elif not self.pod.exists:
+        else:
             self.pod.create()
-            self.results['actions'].append('created %s' % self.pod.name)
+            self.results['actions'].append(f'created {self.name}')
             changed = True
         return changed
 
@@ -938,7 +951,7 @@ class PodmanPodManager:
         """Run actions if desired state is 'killed'."""
         self._create_or_recreate_pod()
         self.pod.kill()
-        self.results['actions'].append('killed %s' % self.pod.name)
+        self.results['actions'].append(f'killed {self.name}')
         self.update_pod_result()
 
     def make_paused(self):
@@ -948,7 +961,7 @@ class PodmanPodManager:
             self.update_pod_result(changed=changed)
             return
         self.pod.pause()
-        self.results['actions'].append('paused %s' % self.pod.name)
+        self.results['actions'].append(f'paused {self.name}')
         self.update_pod_result()
 
     def make_unpaused(self):
@@ -958,7 +971,7 @@ class PodmanPodManager:
             self.update_pod_result(changed=changed)
             return
         self.pod.unpause()
-        self.results['actions'].append('unpaused %s' % self.pod.name)
+        self.results['actions'].append(f'unpaused {self.name}')
         self.update_pod_result()
 
     def make_started(self):
@@ -970,16 +983,16 @@ class PodmanPodManager:
 
         # self.pod.unpause()  TODO(sshnaidm): to unpause if state == started?
         self.pod.start()
-        self.results['actions'].append('started %s' % self.pod.name)
+        self.results['actions'].append(f'started {self.name}')
         self.update_pod_result()
 
     def make_stopped(self):
         """Run actions if desired state is 'stopped'."""
         if not self.pod.exists:
-            self.module.fail_json("Pod %s doesn't exist!" % self.pod.name)
+            self.module.fail_json("Pod %s doesn't exist!" % self.name)
         if self.pod.running:
             self.pod.stop()
-            self.results['actions'].append('stopped %s' % self.pod.name)
+            self.results['actions'].append(f'stopped {self.name}')
             self.update_pod_result()
         elif self.pod.stopped:
             self.update_pod_result(changed=False)
@@ -988,25 +1001,26 @@ class PodmanPodManager:
         """Run actions if desired state is 'restarted'."""
         if self.pod.exists:
             self.pod.restart()
-            self.results['actions'].append('restarted %s' % self.pod.name)
+            self.results['actions'].append(f'restarted {self.name}')
             self.results.update({'changed': True})
             self.update_pod_result()
         else:
-            self.module.fail_json("Pod %s doesn't exist!" % self.pod.name)
+            self.module.fail_json("Pod %s doesn't exist!" % self.name)
 
     def make_absent(self):
         """Run actions if desired state is 'absent'."""
         if not self.pod.exists:
-            self.results.update({'changed': False})
-        elif self.pod.exists:
+            changed = False
+        else:
             delete_systemd(self.module,
                            self.module_params,
                            self.name,
                            self.pod.version)
             self.pod.delete()
-            self.results['actions'].append('deleted %s' % self.pod.name)
-            self.results.update({'changed': True})
-        self.results.update({'pod': {},
+            self.results['actions'].append(f'deleted {self.name}')
+            changed = True
+        self.results.update({'changed': changed,
+                             'pod': {},
                              'podman_actions': self.pod.actions})
 
     def make_quadlet(self):
@@ -231,11 +231,6 @@ EXAMPLES = '''
       - "ExitCodePropagation=any"
 '''
 import re  # noqa: F402
-try:
-    import yaml
-    HAS_YAML = True
-except ImportError:
-    HAS_YAML = False
 
 from ansible.module_utils.basic import AnsibleModule  # noqa: F402
 from ansible_collections.containers.podman.plugins.module_utils.podman.common import LooseVersion, get_podman_version
@@ -333,7 +328,12 @@ class PodmanKubeManagement:
     def discover_pods(self):
         pod_name = ''
         if self.module.params['kube_file']:
-            if HAS_YAML:
+            # PyYAML is only needed here, import it lazily to keep module start cheap
+            try:
+                import yaml
+            except ImportError:
+                yaml = None
+            if yaml is not None:
                 with open(self.module.params['kube_file']) as f:
                     pods = list(yaml.safe_load_all(f))
                 for pod in pods:
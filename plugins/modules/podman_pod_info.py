@@ -150,12 +150,22 @@ pods:
             ]
 """
 
-import json
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
 from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.containers.podman.plugins.module_utils.podman.common import LooseVersion
+from ansible_collections.containers.podman.plugins.module_utils.podman.common import get_podman_version
+
+
+def batch_inspect_supported(module):
+    # 'podman pod inspect' accepts several pods only since podman 5.0
+    podman_version = get_podman_version(module, fail=False)
+    return podman_version is not None and LooseVersion(podman_version) >= LooseVersion('5.0.0')
 
 
 def get_pod_info(module, executable, name):
-    command = [executable, 'pod', 'inspect']
     pods = [name]
     result = []
     errs = []
@@ -165,20 +175,31 @@ def get_pod_info(module, executable, name):
         rc, out, err = module.run_command(all_names)
         if rc != 0:
             module.fail_json(msg="Unable to get list of pods: %s" % err)
-        name = out.split()
-        if not name:
+        pods = out.split()
+        if not pods:
             return [], [err], [rc]
-        pods = name
+    command = [executable, 'pod', 'inspect']
+    if len(pods) > 1 and batch_inspect_supported(module):
+        # Inspect all pods in one call, podman returns a list of them
+        rc, out, err = module.run_command(command + pods)
+        if rc == 0:
+            data = json_loads(out) if out else None
+            if isinstance(data, dict):
+                data = [data]
+            return data or [], [err.strip()], [rc]
+        # Some pod doesn't exist anymore, fall back to inspecting them one by one
     for pod in pods:
         rc, out, err = module.run_command(command + [pod])
         errs.append(err.strip())
-        rcs += [rc]
-        data = json.loads(out) if out else None
-        if isinstance(data, list) and data:
-            data = data[0]
-        if not out or data is None or not data:
+        rcs.append(rc)
+        # Nothing to parse for a pod that can't be inspected
+        if rc != 0 or not out:
             continue
-        result.append(data)
+        data = json_loads(out)
+        if isinstance(data, list):
+            data = data[0] if data else None
+        if data:
+            result.append(data)
     return result, errs, rcs
 
 
@@ -195,14 +216,15 @@ def main():
     executable = module.get_bin_path(module.params['executable'], required=True)
 
     inspect_results, errs, rcs = get_pod_info(module, executable, name)
+    stderr = "\n".join(errs)
 
     if len(rcs) > 1 and 0 not in rcs:
-        module.fail_json(msg="Failed to inspect pods", stderr="\n".join(errs))
+        module.fail_json(msg="Failed to inspect pods", stderr=stderr)
 
     results = {
         "changed": False,
         "pods": inspect_results,
-        "stderr": "\n".join(errs),
+        "stderr": stderr,
     }
 
     module.exit_json(**results)
@@ -52,6 +52,15 @@ options:
               https://docs.podman.io/en/latest/markdown/podman-image-prune.1.html#filter-filters)
               for more information on possible filters.
         type: dict
+    image_until_empty:
+        description:
+            - Whether to repeat image pruning until no more images are deleted.
+            - Deleting an image can leave its parent images unused, so a single prune may not delete
+              everything that can be pruned.
+            - Pruning is repeated at most 50 times.
+        type: bool
+        default: false
+        version_added: '1.17.0'
     network:
         description:
             - Whether to prune networks.
@@ -101,6 +110,13 @@ EXAMPLES = r'''
           # only consider containers created more than 24 hours ago
           until: 24h
 
+- name: Prune all unused images, including parents left unused by pruned images
+  containers.podman.podman_prune:
+      image: true
+      image_filters:
+          dangling_only: false
+      image_until_empty: true
+
 - name: Prune everything
   containers.podman.podman_prune:
       system: true
@@ -159,40 +175,80 @@ system:
   sample: []
 '''
 
+import os
 
 from ansible.module_utils.basic import AnsibleModule
 
 
-def filtersPrepare(target, filters):
+def filterArgs(name, value):
+    if isinstance(value, dict):
+        return [f'--filter={name}={key}={val}' for key, val in value.items()]
+    return [f'--filter={name}={value}']
+
+
+def commonFilters(filters):
     filter_out = []
-    if target == 'system':
-        for system_filter in filters:
-            filter_out.append(filters[system_filter])
-    else:
-        for common_filter in filters:
-            if isinstance(filters[common_filter], dict):
-                dict_filters = filters[common_filter]
-                for single_filter in dict_filters:
-                    filter_out.append('--filter={label}={key}={value}'.format(label=common_filter, key=single_filter,
-                                                                              value=dict_filters[single_filter]))
-            else:
-                if target == 'image' and (common_filter in ('dangling_only', 'external')):
-                    if common_filter == 'dangling_only' and not filters['dangling_only']:
-                        filter_out.append('-a')
-                    if common_filter == 'external' and filters['external']:
-                        filter_out.append('--external')
-                else:
-                    filter_out.append('--filter={label}={value}'.format(label=common_filter,
-                                                                        value=filters[common_filter]))
+    for name, value in filters.items():
+        filter_out.extend(filterArgs(name, value))
+    return filter_out
 
+
+def imageFilters(filters):
+    filter_out = []
+    for name, value in filters.items():
+        if name == 'dangling_only':
+            if not value:
+                filter_out.append('-a')
+        elif name == 'external':
+            if value:
+                filter_out.append('--external')
+        else:
+            filter_out.extend(filterArgs(name, value))
     return filter_out
 
 
-def podmanExec(module, target, filters, executable):
+FILTER_BUILDERS = {
+    'image': imageFilters,
+}
+
+# Targets pruned with their filters, in order. Pruned containers release
+# images, networks and volumes, so containers are pruned first
+PRUNE_TARGETS = (
+    ('container', 'container_filters'),
+    ('image', 'image_filters'),
+    ('network', 'network_filters'),
+    ('volume', 'volume_filters'),
+)
+
+
+def filtersPrepare(target, filters):
+    return FILTER_BUILDERS.get(target, commonFilters)(filters)
+
+
+def podmanCommand(executable, target, filters):
     command = [executable, target, 'prune', '--force']
     if filters is not None:
         command.extend(filtersPrepare(target, filters))
-    rc, out, err = module.run_command(command)
+    return command
+
+
+def podmanRun(module, command):
+    return module.run_command(command, expand_user_and_vars=False)
+
+
+def podmanRunUntilEmpty(module, command, max_runs=50):
+    outs, errs = [], []
+    for dummy in range(max_runs):
+        rc, out, err = podmanRun(module, command)
+        outs.append(out)
+        if err:
+            errs.append(err.rstrip('\n'))
+        if rc != 0 or not out.strip():
+            break
+    return rc, "\n".join(outs), "\n".join(errs)
+
+
+def podmanResult(module, target, rc, out, err):
     changed = bool(out)
 
     if rc != 0:
@@ -201,7 +257,7 @@ def podmanExec(module, target, filters, executable):
 
     return {
         "changed": changed,
-        target: list(filter(None, out.split('\n'))),
+        target: [line for line in out.splitlines() if line],
         "errors": err
     }
 
@@ -213,6 +269,7 @@ def main():
         container_filters=dict(type='dict'),
         image=dict(type='bool', default=False),
         image_filters=dict(type='dict'),
+        image_until_empty=dict(type='bool', default=False),
         network=dict(type='bool', default=False),
         network_filters=dict(type='dict'),
         volume=dict(type='bool', default=False),
@@ -227,23 +284,31 @@ def main():
         argument_spec=module_args
     )
 
-    executable = module.get_bin_path(
-        module.params['executable'], required=True)
+    executable = module.params['executable']
+    # An absolute path to an executable file doesn't need a $PATH lookup
+    if not (os.path.isabs(executable) and os.path.isfile(executable) and
+            os.access(executable, os.X_OK)):
+        executable = module.get_bin_path(executable, required=True)
 
-    for target, filters in (
-            ('container', 'container_filters'), ('image', 'image_filters'), ('network', 'network_filters'),
-            ('volume', 'volume_filters')):
-        if module.params[target]:
-            results[target] = podmanExec(module, target, module.params[filters], executable)
+    for target, filters in PRUNE_TARGETS:
+        if not module.params[target]:
+            continue
+        command = podmanCommand(executable, target, module.params[filters])
+        if target == 'image' and module.params['image_until_empty']:
+            rc, out, err = podmanRunUntilEmpty(module, command)
+        else:
+            rc, out, err = podmanRun(module, command)
+        results[target] = podmanResult(module, target, rc, out, err)
 
     if module.params['system']:
         target = 'system'
-        system_filters = {}
+        command = [executable, target, 'prune', '--force']
         if module.params['system_all']:
-            system_filters['system_all'] = '--all'
+            command.append('--all')
         if module.params['system_volumes']:
-            system_filters['system_volumes'] = '--volumes'
-        results[target] = podmanExec(module, target, system_filters, executable)
+            command.append('--volumes')
+        rc, out, err = podmanRun(module, command)
+        results[target] = podmanResult(module, target, rc, out, err)
 
     module.exit_json(**results)
 
@@ -85,19 +85,20 @@ import os  # noqa: E402
 from ansible.module_utils.basic import AnsibleModule  # noqa: E402
 from ..module_utils.podman.common import remove_file_or_dir  # noqa: E402
 
+SAVE_ARGS = (
+    ('compress', lambda v: ['--compress'] if v else []),
+    ('dest', lambda v: ['-o=%s' % v]),
+    ('format', lambda v: ['--format=%s' % v]),
+    ('multi_image_archive', lambda v: ['--multi-image-archive'] if v else []),
+)
+
 
 def save(module, executable):
     changed = False
     command = [executable, 'save']
-    cmd_args = {
-        'compress': ['--compress'],
-        'dest': ['-o=%s' % module.params['dest']],
-        'format': ['--format=%s' % module.params['format']],
-        'multi_image_archive': ['--multi-image-archive'],
-    }
-    for param in module.params:
-        if module.params[param] is not None and param in cmd_args:
-            command += cmd_args[param]
+    for param, build in SAVE_ARGS:
+        if module.params[param] is not None:
+            command += build(module.params[param])
     for img in module.params['image']:
         command.append(img)
     if module.params['force']:
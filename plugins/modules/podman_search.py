@@ -75,7 +75,10 @@ images:
     ]
 """
 
-import json
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
 
 from ansible.module_utils.basic import AnsibleModule
 
@@ -116,8 +119,8 @@ def main():
         results = []
     else:
         try:
-            results = json.loads(result_str)
-        except json.decoder.JSONDecodeError:
+            results = json_loads(result_str)
+        except ValueError:
             module.fail_json(msg='Failed to parse JSON output from podman search: {out}'.format(out=result_str))
 
     results = dict(
@@ -116,112 +116,104 @@ from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.containers.podman.plugins.module_utils.podman.common import LooseVersion
 from ansible_collections.containers.podman.plugins.module_utils.podman.common import get_podman_version
 
-diff = {"before": '', "after": ''}
 
-
-def podman_secret_exists(module, executable, name, version):
-    if version is None or LooseVersion(version) < LooseVersion('4.5.0'):
-        rc, out, err = module.run_command(
-            [executable, 'secret', 'ls', "--format", "{{.Name}}"])
-        return name in [i.strip() for i in out.splitlines()]
+def podman_secret_exists(module, executable, name):
+    # Unlike 'secret exists', 'secret inspect' is available on every podman
+    # version with secrets, so no version probe is needed first
     rc, out, err = module.run_command(
-        [executable, 'secret', 'exists', name])
+        [executable, 'secret', 'inspect', name])
     return rc == 0
 
 
-def need_update(module, executable, name, data, path, env, skip, driver, driver_opts, debug, labels):
+def podman_secret_inspect(module, executable, name, debug):
     cmd = [executable, 'secret', 'inspect', '--showsecret', name]
     rc, out, err = module.run_command(cmd)
     if rc != 0:
         if debug:
             module.log("PODMAN-SECRET-DEBUG: Unable to get secret info: %s" % err)
-        return True
-    if skip:
-        return False
+        return None
+    return out
+
+
+# Returns (changed, before, after), where before and after describe the first difference
+def need_update(module, out, data, path, env, driver, driver_opts, debug, labels):
     try:
         secret = module.from_json(out)[0]
+        spec = secret['Spec']
         # We support only file driver for now
-        if (driver and driver != 'file') or secret['Spec']['Driver']['Name'] != 'file':
+        if (driver and driver != 'file') or spec['Driver']['Name'] != 'file':
             if debug:
                 module.log("PODMAN-SECRET-DEBUG: Idempotency of driver %s is not supported" % driver)
-            return True
+            return True, '', ''
         if data:
             if secret['SecretData'] != data:
                 if debug:
-                    diff['after'] = data
-                    diff['before'] = secret['SecretData']
-                else:
-                    diff['after'] = "<different-secret>"
-                    diff['before'] = "<secret>"
-                return True
+                    return True, secret['SecretData'], data
+                return True, "<secret>", "<different-secret>"
         if path:
-            with open(path, 'rb') as f:
-                text = f.read().decode('utf-8')
-            if secret['SecretData'] != text:
+            # Compare raw bytes, the file is decoded only to show it in debug diff.
+            # Without debug it isn't read at all when its size already differs.
+            secret_data = secret['SecretData'].encode('utf-8')
+            file_data = None
+            if debug or os.path.getsize(path) == len(secret_data):
+                with open(path, 'rb') as f:
+                    file_data = f.read()
+            if secret_data != file_data:
                 if debug:
-                    diff['after'] = text
-                    diff['before'] = secret['SecretData']
-                else:
-                    diff['after'] = "<different-secret>"
-                    diff['before'] = "<secret>"
-                return True
+                    return True, secret['SecretData'], file_data.decode('utf-8', errors='replace')
+                return True, "<secret>", "<different-secret>"
         if env:
             env_data = os.environ.get(env)
             if secret['SecretData'] != env_data:
                 if debug:
-                    diff['after'] = env_data
-                    diff['before'] = secret['SecretData']
-                else:
-                    diff['after'] = "<different-secret>"
-                    diff['before'] = "<secret>"
-                return True
+                    return True, secret['SecretData'], env_data
+                return True, "<secret>", "<different-secret>"
 
-        if driver_opts:
-            for k, v in driver_opts.items():
-                if secret['Spec']['Driver']['Options'].get(k) != v:
-                    diff['after'] = "=".join([k, v])
-                    diff['before'] = "=".join(
-                        [k, secret['Spec']['Driver']['Options'].get(k)])
-                    return True
-        if labels:
-            for k, v in labels.items():
-                if secret['Spec']['Labels'].get(k) != v:
-                    diff['after'] = "=".join([k, v])
-                    diff['before'] = "=".join(
-                        [k, secret['Spec']['Labels'].get(k)])
-                    return True
+        for wanted, current in ((driver_opts, spec['Driver']['Options']),
+                                (labels, spec['Labels'])):
+            for k, v in (wanted or {}).items():
+                current_value = (current or {}).get(k)
+                if current_value != v:
+                    return True, "=".join([k, current_value]), "=".join([k, v])
     except Exception:
-        return True
-    return False
+        return True, '', ''
+    return False, '', ''
 
 
 def podman_secret_create(module, executable, name, data, path, env, force, skip,
                          driver, driver_opts, debug, labels):
-    podman_version = get_podman_version(module, fail=False)
-    if (podman_version is not None and
-        LooseVersion(podman_version) >= LooseVersion('4.7.0')
-            and (driver is None or driver == 'file')):
-        if need_update(module, executable, name, data, path, env, skip, driver, driver_opts, debug, labels):
-            podman_secret_remove(module, executable, name)
-        else:
+    before = after = ''
+    if skip and not force:
+        # Only existence of the secret matters, nothing else to compare
+        if podman_secret_exists(module, executable, name):
             return {"changed": False}
     else:
-        if force:
+        podman_version = get_podman_version(module, fail=False)
+        if (podman_version is not None and
+            LooseVersion(podman_version) >= LooseVersion('4.7.0')
+                and (driver is None or driver == 'file')):
+            # The inspect output tells both whether the secret exists and what
+            # it holds, a secret that doesn't exist doesn't need to be removed
+            out = podman_secret_inspect(module, executable, name, debug)
+            if out is not None:
+                if skip:
+                    return {"changed": False}
+                changed, before, after = need_update(
+                    module, out, data, path, env, driver, driver_opts, debug, labels)
+                if not changed:
+                    return {"changed": False}
+                podman_secret_remove(module, executable, name)
+        elif force:
             podman_secret_remove(module, executable, name)
-        if skip and podman_secret_exists(module, executable, name, podman_version):
-            return {"changed": False}
 
     cmd = [executable, 'secret', 'create']
     if driver:
-        cmd.append('--driver')
-        cmd.append(driver)
+        cmd.extend(('--driver', driver))
     if driver_opts:
-        cmd.append('--driver-opts')
-        cmd.append(",".join("=".join(i) for i in driver_opts.items()))
+        cmd.extend(('--driver-opts', ",".join(f"{k}={v}" for k, v in driver_opts.items())))
     if labels:
         for k, v in labels.items():
-            cmd.append('--label')
-            cmd.append("=".join([k, v]))
+            cmd.extend(('--label', f"{k}={v}"))
     cmd.append(name)
     if data:
         cmd.append('-')
@@ -230,8 +222,7 @@ def podman_secret_create(module, executable, name, data, path, env, force, skip,
     elif env:
         if os.environ.get(env) is None:
             module.fail_json(msg="Environment variable %s is not set" % env)
-        cmd.append("--env")
-        cmd.append(env)
+        cmd.extend(("--env", env))
 
     if data:
         rc, out, err = module.run_command(cmd, data=data, binary_data=True)
@@ -243,8 +234,8 @@ def podman_secret_create(module, executable, name, data, path, env, force, skip,
     return {
         "changed": True,
         "diff": {
-            "before": diff['before'] + "\n",
-            "after": diff['after'] + "\n",
+            "before": before + "\n",
+            "after": after + "\n",
         },
     }
 
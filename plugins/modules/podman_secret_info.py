@@ -87,9 +87,8 @@ def get_secret_info(module, executable, show, name):
     rc, out, err = module.run_command(command)
     if rc != 0 or 'no secret with name or id' in err:
         module.fail_json(msg="Unable to gather info for %s: %s" % (name or 'all secrets', err))
-    if not out or json.loads(out) is None:
-        return [], out, err
-    return json.loads(out), out, err
+    data = json.loads(out) if out else None
+    return data or [], out, err
 
 
 def main():
@@ -156,6 +156,7 @@ from ansible.module_utils.basic import AnsibleModule  # noqa: F402
 from ansible.module_utils._text import to_bytes, to_native  # noqa: F402
 from ansible_collections.containers.podman.plugins.module_utils.podman.common import LooseVersion
 from ansible_collections.containers.podman.plugins.module_utils.podman.common import lower_keys
+from ansible_collections.containers.podman.plugins.module_utils.podman.common import sorted_unique
 from ansible_collections.containers.podman.plugins.module_utils.podman.quadlet import create_quadlet_state
 
 
@@ -311,7 +312,7 @@ class PodmanVolumeDiff:
         #                 ids += opt.split("o=")[1].split(",")
         #     after = [i for i in after if 'gid' not in i and 'uid' not in i]
         #     after += ids
-        before, after = sorted(list(set(before))), sorted(list(set(after)))
+        before, after = sorted_unique(before), sorted_unique(after)
         return self._diff_update_and_compare('options', before, after)
 
     def is_different(self):
@@ -73,9 +73,10 @@ def get_volume_info(module, executable, name):
     rc, out, err = module.run_command(command)
     if rc != 0 or 'no such volume' in err:
         module.fail_json(msg="Unable to gather info for %s: %s" % (name or 'all volumes', err))
-    if not out or json.loads(out) is None:
+    data = json.loads(out) if out else None
+    if data is None:
         return [], out, err
-    return json.loads(out), out, err
+    return data, out, err
 
 
 def main():
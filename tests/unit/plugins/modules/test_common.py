@@ -4,7 +4,9 @@ __metaclass__ = type
 import pytest
 
 from ansible_collections.containers.podman.plugins.module_utils.podman.common import (
+    compare_systemd_file_content,
     lower_keys,
+    sorted_unique,
 )
 
 
@@ -17,3 +19,28 @@ from ansible_collections.containers.podman.plugins.module_utils.podman.common im
 def test_lower_keys(test_input, expected):
     print(lower_keys.__code__.co_filename)
     assert lower_keys(test_input) == expected
+
+
+@pytest.mark.parametrize('current, new, expected', [
+    ("[Unit]\nA=1\n", "[Unit]\nA=1\n", None),
+    ("# comment\n[Unit]\nA=1", "[Unit]\nA=1", None),
+    ("[Unit]\nA=1\n", "[Unit]\nA=2\n", (["A=1"], ["A=2"])),
+])
+def test_compare_systemd_file_content(tmp_path, current, new, expected):
+    unit_file = tmp_path / "test.service"
+    unit_file.write_text(current)
+    assert compare_systemd_file_content(str(unit_file), new) == expected
+
+
+def test_compare_systemd_file_content_missing(tmp_path):
+    new = "[Unit]\nA=1\n"
+    assert compare_systemd_file_content(str(tmp_path / "missing.service"), new) == ('', new)
+
+
+@pytest.mark.parametrize('test_input, expected', [
+    (None, []),
+    ([], []),
+    (["cap_b", "cap_a", "cap_b"], ["cap_a", "cap_b"]),
+])
+def test_sorted_unique(test_input, expected):
+    assert sorted_unique(test_input) == expected
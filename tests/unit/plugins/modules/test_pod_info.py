@@ -0,0 +1,61 @@
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import json
+
+from ansible_collections.containers.podman.plugins.modules.podman_pod_info import (
+    get_pod_info,
+)
+from ansible_collections.containers.podman.tests.unit.plugins.modules.utils import FakeModule
+
+
+def pod_module(responses, version='5.0.0'):
+    def respond(command):
+        if command[1] == b'--version':
+            return 0, 'podman version %s' % version, ''
+        return responses[tuple(command[2:])]
+    return FakeModule(respond, params={'executable': 'podman'})
+
+
+def test_pod_info_batch_inspect():
+    module = pod_module({
+        ('ls', '-q'): (0, "pod1\npod2\n", ''),
+        ('inspect', 'pod1', 'pod2'): (0, json.dumps([{'Name': 'pod1'}, {'Name': 'pod2'}]), ''),
+    })
+    result, errs, rcs = get_pod_info(module, 'podman', None)
+    assert result == [{'Name': 'pod1'}, {'Name': 'pod2'}]
+    assert rcs == [0]
+    assert len(module.commands) == 3
+
+
+def test_pod_info_batch_inspect_fallback():
+    module = pod_module({
+        ('ls', '-q'): (0, "pod1\npod2\n", ''),
+        ('inspect', 'pod1', 'pod2'): (125, '', 'no such pod pod2'),
+        ('inspect', 'pod1'): (0, json.dumps([{'Name': 'pod1'}]), ''),
+        ('inspect', 'pod2'): (125, '', 'no such pod pod2'),
+    })
+    result, errs, rcs = get_pod_info(module, 'podman', None)
+    assert result == [{'Name': 'pod1'}]
+    assert rcs == [0, 125]
+    assert errs == ['', 'no such pod pod2']
+
+
+def test_pod_info_no_pods():
+    module = pod_module({
+        ('ls', '-q'): (0, "", ''),
+    })
+    assert get_pod_info(module, 'podman', None) == ([], [''], [0])
+
+
+def test_pod_info_no_batch_inspect_before_podman_5():
+    module = pod_module({
+        ('ls', '-q'): (0, "pod1\npod2\n", ''),
+        ('inspect', 'pod1'): (0, json.dumps({'Name': 'pod1'}), ''),
+        ('inspect', 'pod2'): (0, json.dumps({'Name': 'pod2'}), ''),
+    }, version='4.9.3')
+    result, errs, rcs = get_pod_info(module, 'podman', None)
+    assert result == [{'Name': 'pod1'}, {'Name': 'pod2'}]
+    assert rcs == [0, 0]
+    assert ['podman', 'pod', 'inspect', 'pod1', 'pod2'] not in module.commands
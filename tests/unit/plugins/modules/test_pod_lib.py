@@ -0,0 +1,90 @@
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import json
+
+import pytest
+
+from ansible_collections.containers.podman.plugins.module_utils.podman import podman_pod_lib
+from ansible_collections.containers.podman.plugins.module_utils.podman.podman_pod_lib import (
+    PodmanPod,
+    PodmanPodDiff,
+)
+from ansible_collections.containers.podman.tests.unit.plugins.modules.utils import FakeModule
+
+
+def pod_respond(command):
+    if command[1] == b'--version':
+        return 0, 'podman version 4.9.0', ''
+    if command[1:3] == [b'pod', b'inspect']:
+        return 0, json.dumps([{'Name': 'mypod', 'State': 'Running'}]), ''
+    if command[1:3] == [b'pod', b'ps']:
+        return 0, json.dumps([{'Name': 'mypod', 'Status': 'Running'}]), ''
+    return 0, '', ''
+
+
+@pytest.fixture
+def pod(monkeypatch):
+    class FakeParams:
+        def __init__(self, action, *args):
+            self.action = action
+
+        def construct_command_from_params(self):
+            return [self.action.encode(), b'mypod']
+
+    monkeypatch.setattr(podman_pod_lib, 'PodmanPodModuleParams', FakeParams)
+    module = FakeModule(pod_respond, params={'executable': 'podman'})
+    module._diff = False
+    return PodmanPod(module, 'mypod', module.params)
+
+
+@pytest.mark.parametrize(
+    "before, after, expected",
+    [
+        ("aaa", "aaa", False),
+        (None, "", False),
+        ([], {}, False),
+        (None, None, False),
+        ("aaa", "bbb", True),
+        (None, "bbb", True),
+        (True, False, True),
+    ],
+)
+def test_pod_diff_update_and_compare(before, after, expected):
+    diff = PodmanPodDiff(None, {}, {}, {}, "4.1.1")
+    assert diff._diff_update_and_compare("param", before, after) == expected
+    if expected:
+        assert diff.diff == {"before": {"param": before}, "after": {"param": after}}
+    else:
+        assert diff.diff == {"before": {}, "after": {}}
+
+
+def test_pod_different_is_cached(pod, monkeypatch):
+    built = []
+
+    class FakeDiff:
+        def __init__(self, *args):
+            built.append(args)
+            self.diff = {'before': {}, 'after': {}}
+
+        def is_different(self):
+            return True
+
+    monkeypatch.setattr(podman_pod_lib, 'PodmanPodDiff', FakeDiff)
+    assert pod.different
+    assert pod.different
+    assert len(built) == 1
+
+
+def ps_commands(module):
+    return [command for command in module.commands if command[1:3] == [b'pod', b'ps']]
+
+
+def test_pod_ps_is_cached(pod):
+    assert pod.get_ps() == {'Name': 'mypod', 'Status': 'Running'}
+    assert pod.get_ps() == {'Name': 'mypod', 'Status': 'Running'}
+    assert len(ps_commands(pod.module)) == 1
+    pod.start()
+    pod.get_ps()
+    assert len(ps_commands(pod.module)) == 2
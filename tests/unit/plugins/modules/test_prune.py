@@ -0,0 +1,150 @@
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import pytest
+
+from ansible_collections.containers.podman.plugins.modules import podman_prune
+from ansible_collections.containers.podman.plugins.modules.podman_prune import (
+    filtersPrepare,
+    podmanCommand,
+    podmanResult,
+    podmanRun,
+    podmanRunUntilEmpty,
+)
+from ansible_collections.containers.podman.tests.unit.plugins.modules.utils import (
+    ExitJson,
+    FailJson,
+    FakeModule,
+    fixed,
+    sequence,
+)
+
+
+@pytest.mark.parametrize(
+    "target, filters, expected",
+    [
+        ('container', {'until': '24h'}, ['--filter=until=24h']),
+        ('volume', {'label': {'app': 'web', 'env': 'prod'}},
+         ['--filter=label=app=web', '--filter=label=env=prod']),
+        ('image', {'dangling_only': False, 'external': True, 'until': '1h'},
+         ['-a', '--external', '--filter=until=1h']),
+        ('image', {'dangling_only': True, 'external': False}, []),
+        ('network', {'dangling_only': False}, ['--filter=dangling_only=False']),
+    ],
+)
+def test_filters_prepare(target, filters, expected):
+    assert filtersPrepare(target, filters) == expected
+
+
+def test_podman_command():
+    command = podmanCommand('podman', 'image', {'until': '1h'})
+    assert command == ['podman', 'image', 'prune', '--force', '--filter=until=1h']
+    assert podmanCommand('podman', 'volume', None) == ['podman', 'volume', 'prune', '--force']
+
+
+def test_podman_result():
+    module = FakeModule(fixed(out='aaa\nbbb\n'))
+    rc, out, err = podmanRun(module, ['podman', 'image', 'prune', '--force'])
+    assert module.commands == [['podman', 'image', 'prune', '--force']]
+    assert podmanResult(module, 'image', rc, out, err) == {'changed': True, 'image': ['aaa', 'bbb'], 'errors': ''}
+
+
+def test_podman_result_nothing_pruned():
+    assert podmanResult(FakeModule(), 'volume', 0, '', '') == {'changed': False, 'volume': [], 'errors': ''}
+
+
+def test_podman_run_until_empty():
+    module = FakeModule(sequence([(0, 'aaa\nbbb\n', ''), (0, 'ccc\n', ''), (0, '', '')]))
+    rc, out, err = podmanRunUntilEmpty(module, ['podman', 'image', 'prune', '--force'])
+    assert len(module.commands) == 3
+    assert podmanResult(module, 'image', rc, out, err) == {
+        'changed': True, 'image': ['aaa', 'bbb', 'ccc'], 'errors': ''}
+
+
+def test_podman_run_until_empty_errors():
+    module = FakeModule(sequence([(0, 'aaa\n', 'warning one'), (0, 'bbb\n', ''), (0, '', 'warning two\n')]))
+    rc, out, err = podmanRunUntilEmpty(module, ['podman', 'image', 'prune', '--force'])
+    assert err == 'warning one\nwarning two'
+
+
+def test_podman_run_until_empty_limit():
+    module = FakeModule(sequence([(0, 'aaa\n', '')] * 3))
+    podmanRunUntilEmpty(module, ['podman', 'image', 'prune', '--force'], max_runs=2)
+    assert len(module.commands) == 2
+
+
+def run_main(monkeypatch, respond, **params):
+    modules = []
+
+    def fake_ansible_module(argument_spec, **kwargs):
+        module_params = dict((key, spec.get('default')) for key, spec in argument_spec.items())
+        module_params.update(params)
+        modules.append(FakeModule(respond, params=module_params))
+        return modules[0]
+
+    monkeypatch.setattr(podman_prune, 'AnsibleModule', fake_ansible_module)
+    with pytest.raises((ExitJson, FailJson)) as result:
+        podman_prune.main()
+    return modules[0], result
+
+
+def test_main_prune_order(monkeypatch):
+    module, result = run_main(monkeypatch, lambda command: (0, command[1] + '1\n', ''),
+                              container=True, image=True, network=True, volume=True, system=True,
+                              image_filters={'until': '1h'})
+    assert [command[1] for command in module.commands] == ['container', 'image', 'network', 'volume', 'system']
+    assert module.commands[1] == ['podman', 'image', 'prune', '--force', '--filter=until=1h']
+    assert result.type is ExitJson
+    results = result.value.args[0]
+    assert sorted(results) == ['container', 'image', 'network', 'system', 'volume']
+    assert results['network'] == {'changed': True, 'network': ['network1'], 'errors': ''}
+
+
+def test_main_prune_only_requested(monkeypatch):
+    module, result = run_main(monkeypatch, fixed(), volume=True)
+    assert module.commands == [['podman', 'volume', 'prune', '--force']]
+    assert result.value.args[0] == {'volume': {'changed': False, 'volume': [], 'errors': ''}}
+
+
+def test_main_prune_failure_stops(monkeypatch):
+    def respond(command):
+        if command[1] == 'image':
+            return 125, '', 'image is in use'
+        return 0, '', ''
+
+    module, result = run_main(monkeypatch, respond, container=True, image=True, volume=True)
+    assert [command[1] for command in module.commands] == ['container', 'image']
+    assert result.type is FailJson
+    assert result.value.args[0]['msg'] == 'Error executing prune on image: image is in use'
+
+
+def test_main_executable_lookup(monkeypatch, tmp_path):
+    lookups = []
+    monkeypatch.setattr(FakeModule, 'get_bin_path', lambda self, arg, required=False: lookups.append(arg) or arg)
+    podman = tmp_path / 'podman'
+    podman.write_text('')
+    podman.chmod(0o755)
+    module, result = run_main(monkeypatch, fixed(), volume=True, executable=str(podman))
+    assert lookups == []
+    assert module.commands[0][0] == str(podman)
+    # A directory is executable too, but only get_bin_path can tell it isn't podman
+    run_main(monkeypatch, fixed(), volume=True, executable=str(tmp_path))
+    assert lookups == [str(tmp_path)]
+
+
+def test_main_image_until_empty(monkeypatch):
+    module, result = run_main(monkeypatch, sequence([(0, 'aaa\n', ''), (0, 'bbb\n', ''), (0, '', '')]),
+                              image=True, image_until_empty=True)
+    assert module.commands == [['podman', 'image', 'prune', '--force']] * 3
+    assert result.value.args[0]['image'] == {'changed': True, 'image': ['aaa', 'bbb'], 'errors': ''}
+
+
+def test_main_image_until_empty_without_image(monkeypatch):
+    module, result = run_main(monkeypatch, fixed(out='aaa\n'), volume=True, image_until_empty=True)
+    assert module.commands == [['podman', 'volume', 'prune', '--force']]
+
+
+def test_main_image_single_prune(monkeypatch):
+    module, result = run_main(monkeypatch, fixed(out='aaa\n'), image=True)
+    assert module.commands == [['podman', 'image', 'prune', '--force']]
@@ -0,0 +1,32 @@
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import pytest
+
+from ansible_collections.containers.podman.plugins.modules.podman_save import save
+from ansible_collections.containers.podman.tests.unit.plugins.modules.utils import FakeModule
+
+
+def save_module(params):
+    module_params = dict(image=['nginx'], compress=None, dest='/tmp/image.tar', format=None,
+                         multi_image_archive=None, force=False, executable='podman')
+    module_params.update(params)
+    return FakeModule(params=module_params)
+
+
+@pytest.mark.parametrize(
+    "params, expected",
+    [
+        ({}, ['-o=/tmp/image.tar', 'nginx']),
+        ({'compress': True, 'format': 'oci-dir'},
+         ['--compress', '-o=/tmp/image.tar', '--format=oci-dir', 'nginx']),
+        ({'compress': False, 'multi_image_archive': False}, ['-o=/tmp/image.tar', 'nginx']),
+        ({'image': ['nginx', 'fedora'], 'multi_image_archive': True},
+         ['-o=/tmp/image.tar', '--multi-image-archive', 'nginx', 'fedora']),
+    ],
+)
+def test_save_command(params, expected):
+    module = save_module(params)
+    save(module, 'podman')
+    assert module.commands == [['podman', 'save'] + expected]
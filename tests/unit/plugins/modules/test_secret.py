@@ -0,0 +1,92 @@
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import json
+
+from ansible_collections.containers.podman.plugins.modules.podman_secret import podman_secret_create
+from ansible_collections.containers.podman.tests.unit.plugins.modules.utils import FakeModule
+
+
+SECRET = [{
+    'Spec': {'Driver': {'Name': 'file', 'Options': {}}, 'Labels': {}},
+    'SecretData': 'old',
+}]
+
+
+def secret_module(inspect):
+    def respond(command):
+        if command[1] == b'--version':
+            return 0, 'podman version 5.0.0', ''
+        if command[:3] == ['podman', 'secret', 'inspect']:
+            return inspect
+        return 0, '', ''
+    return FakeModule(respond, params={'executable': 'podman'})
+
+
+def subcommands(module):
+    return [command[:3] for command in module.commands]
+
+
+def create(module, data, skip=False):
+    return podman_secret_create(module, 'podman', 'mysecret', data, None, None, False, skip,
+                                None, None, False, None)
+
+
+def test_create_missing_secret():
+    module = secret_module((125, '', 'no such secret'))
+    assert create(module, 'new')['changed']
+    assert ['podman', 'secret', 'rm'] not in subcommands(module)
+    assert subcommands(module)[-1] == ['podman', 'secret', 'create']
+
+
+def test_secret_unchanged():
+    module = secret_module((0, json.dumps(SECRET), ''))
+    assert create(module, 'old') == {'changed': False}
+    assert module.commands[-1] == ['podman', 'secret', 'inspect', '--showsecret', 'mysecret']
+
+
+def test_secret_skip_existing():
+    module = secret_module((0, json.dumps(SECRET), ''))
+    assert create(module, 'new', skip=True) == {'changed': False}
+    # Only existence matters, the secret data isn't fetched
+    assert module.commands == [['podman', 'secret', 'inspect', 'mysecret']]
+
+
+def test_secret_skip_missing():
+    module = secret_module((125, '', 'no such secret'))
+    assert create(module, 'new', skip=True)['changed']
+    assert module.commands == [['podman', 'secret', 'inspect', 'mysecret'],
+                               ['podman', 'secret', 'create', 'mysecret', '-']]
+
+
+def test_secret_recreated():
+    module = secret_module((0, json.dumps(SECRET), ''))
+    assert create(module, 'new')['changed']
+    assert subcommands(module)[-2:] == [['podman', 'secret', 'rm'], ['podman', 'secret', 'create']]
+
+
+def test_secret_label_changed():
+    module = secret_module((0, json.dumps(SECRET), ''))
+    result = podman_secret_create(module, 'podman', 'mysecret', 'old', None, None, False, False,
+                                  None, None, False, {'app': 'web'})
+    assert result['changed']
+    assert subcommands(module)[-2:] == [['podman', 'secret', 'rm'], ['podman', 'secret', 'create']]
+
+
+def test_secret_diff():
+    module = secret_module((0, json.dumps(SECRET), ''))
+    result = podman_secret_create(module, 'podman', 'mysecret', 'new', None, None, False, False,
+                                  None, None, True, None)
+    assert result['diff'] == {'before': 'old\n', 'after': 'new\n'}
+    result = create(secret_module((0, json.dumps(SECRET), '')), 'new')
+    assert result['diff'] == {'before': '<secret>\n', 'after': '<different-secret>\n'}
+
+
+def test_create_command():
+    module = secret_module((125, '', 'no such secret'))
+    podman_secret_create(module, 'podman', 'mysecret', 'new', None, None, False, False,
+                         'file', {'path': '/tmp/secrets'}, False, {'app': 'web', 'tier': 1})
+    assert module.commands[-1] == [
+        'podman', 'secret', 'create', '--driver', 'file', '--driver-opts', 'path=/tmp/secrets',
+        '--label', 'app=web', '--label', 'tier=1', 'mysecret', '-']
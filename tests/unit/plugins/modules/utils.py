@@ -0,0 +1,56 @@
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import json
+
+
+class FailJson(Exception):
+    pass
+
+
+class ExitJson(Exception):
+    pass
+
+
+def fixed(rc=0, out='', err=''):
+    """Answer every command with the same result."""
+    return lambda command: (rc, out, err)
+
+
+def sequence(responses):
+    """Answer commands with the given results, one after another."""
+    responses = list(responses)
+    return lambda command: responses.pop(0)
+
+
+class FakeModule:
+    """Stand-in for AnsibleModule that records the commands it is asked to run.
+
+    ``respond`` is called with every command and returns its (rc, out, err).
+    """
+
+    def __init__(self, respond=None, params=None, check_mode=False):
+        self.respond = respond or fixed()
+        self.params = params or {}
+        self.check_mode = check_mode
+        self.commands = []
+
+    def run_command(self, command, **kwargs):
+        self.commands.append(command)
+        return self.respond(command)
+
+    def from_json(self, data):
+        return json.loads(data)
+
+    def log(self, msg):
+        pass
+
+    def get_bin_path(self, arg, required=False):
+        return arg
+
+    def fail_json(self, **kwargs):
+        raise FailJson(kwargs)
+
+    def exit_json(self, **kwargs):
+        raise ExitJson(kwargs)